@@ -16,11 +16,11 @@ def raw_data_generator(command_queue, raw_queue, config):
             raw_queue (Queue) : Multiprocessing Queue to put the raw data to be processed.
             config (pykg2vec.Config) : Consists of the necessary parameters for training configuration.
     """
-    data = config.knowledge_graph.read_cache_data('triplets_train')
+    data = config.knowledge_graph.read_cache_data('triplets_train_ids')
 
-    number_of_batch = len(data) // config.batch_size
+    number_of_batch = data.shape[1] // config.batch_size
 
-    random_ids = np.random.permutation(len(data))
+    random_ids = np.random.permutation(data.shape[1])
 
     while True:
 
@@ -31,7 +31,7 @@ def raw_data_generator(command_queue, raw_queue, config):
             for batch_idx in range(number_of_batch):
                 pos_start = config.batch_size * batch_idx
                 pos_end = config.batch_size * (batch_idx + 1)
-                raw_data = np.asarray([[data[x].h, data[x].r, data[x].t] for x in random_ids[pos_start:pos_end]])
+                raw_data = data[:, random_ids[pos_start:pos_end]].T
                 raw_queue.put((batch_idx, raw_data))
         else:
             raw_queue.put(None)
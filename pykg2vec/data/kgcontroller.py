@@ -262,6 +262,12 @@ class KnowledgeGraph:
                 triplets = pickle.load(f)
 
                 return triplets
+        elif key == 'triplets_train_ids':
+            with open(str(self.dataset.cache_triplet_paths['train']), 'rb') as f:
+                triplets = pickle.load(f)
+
+                # [3, N] int64 array, so that h, r, t = ... gives three contiguous id arrays.
+                return np.ascontiguousarray(np.array([(t.h, t.r, t.t) for t in triplets], dtype=np.int64).reshape(-1, 3).T)
         elif key == 'triplets_test':
             with open(str(self.dataset.cache_triplet_paths['test']), 'rb') as f:
                 triplets = pickle.load(f)
@@ -302,7 +302,94 @@ class TransD(PairwiseModel):
         return emb_e + torch.sum(emb_e * emb_m, axis=-1, keepdims=True) * proj_vec
 
 
-class TransM(PairwiseModel):
+class _EntityScanModel(PairwiseModel):
+    """
+        Base of the translational models (TransM, TransR) scoring a query against
+        every entity at once during evaluation. The helpers below assume that the
+        model has ent_embeddings and l1_flag, and that the scanned entities are L2-normalized.
+    """
+
+    def __init__(self, model_name):
+        super(_EntityScanModel, self).__init__(model_name)
+        self._norm_ent_cache = None  # normalized entity table, kept during evaluation
+
+    def clear_cache(self):
+        """Function to release the entity tables cached during evaluation."""
+        self._norm_ent_cache = None
+
+    def train(self, mode=True):
+        # train() and eval() switch between updating and scoring the weights,
+        # so the tables cached from the previous weights are dropped.
+        self.clear_cache()
+        return super(_EntityScanModel, self).train(mode)
+
+    def _apply(self, fn):
+        # moving or casting the model (e.g., to(device)) replaces the parameters.
+        self.clear_cache()
+        return super(_EntityScanModel, self)._apply(fn)
+
+    @staticmethod
+    def _rank_candidates(score, topk=-1):
+        """Function to order the candidates the way the evaluator expects (best candidate last).
+
+            A small topk is served by a partial selection of the topk closest candidates
+            (torch.topk) instead of sorting all of them; a negative topk returns the full ordering.
+
+           Args:
+               score (Tensor): Distances of the candidates of shape [b, n].
+               topk (int): Number of candidates to return, -1 for all of them.
+
+            Returns:
+                Tensors: Returns the candidate ids of shape [b, topk].
+        """
+        if topk < 0 or topk >= score.shape[-1]:
+            _, rank = torch.sort(score, dim=-1, descending=True)
+            return rank
+
+        # the topk smallest distances come out closest first, flipped to put the best last.
+        _, rank = torch.topk(score, k=topk, largest=False)
+        return rank.flip(-1)
+
+    def _distance_to_all(self, query, norm_ent_e):
+        """Function to get the distances between the queries and every entity.
+
+           Args:
+               query (Tensor): Query vectors, either h+r or t-r, of shape [b, k].
+               norm_ent_e (Tensor): L2-normalized (and possibly projected) entity embeddings of shape [tot_ent, k].
+
+            Returns:
+                Tensors: Returns the distances of shape [b, tot_ent].
+        """
+        if self.l1_flag:
+            # cdist reduces |q - e| in one kernel without materializing the [b, tot_ent, k] difference.
+            return torch.cdist(query, norm_ent_e, p=1)
+
+        # ||q - e||^2 = ||q||^2 - 2 q.e + ||e||^2, where ||e||^2 = 1 for normalized entities,
+        # so the [b, tot_ent, k] broadcast reduces to a single [b, k] x [k, tot_ent] matmul.
+        dot = torch.matmul(query, norm_ent_e.t())
+        sq_dist = torch.sum(query * query, dim=-1, keepdim=True) - 2 * dot + 1
+        return torch.sqrt(torch.clamp(sq_dist, min=0))
+
+    def _normalized_entities(self):
+        """Function to get the L2-normalized entity table.
+
+            The table is cached while gradients are disabled (i.e., during evaluation),
+            so that every query of an evaluation pass shares it. The cache is dropped by
+            train(), eval(), moving the model, and clear_cache().
+
+            Returns:
+                Tensors: Returns the normalized entity embeddings of shape [tot_ent, k].
+        """
+        weight = self.ent_embeddings.weight
+        if torch.is_grad_enabled():
+            return F.normalize(weight, p=2, dim=-1)
+
+        if self._norm_ent_cache is None:
+            self._norm_ent_cache = F.normalize(weight, p=2, dim=-1)
+        return self._norm_ent_cache
+
+
+class TransM(_EntityScanModel):
     """
         `Transition-based Knowledge Graph Embedding with Relational Mapping Properties`_ (TransM)
         is another line of research that improves TransE by relaxing the overstrict requirement of
@@ -333,17 +420,9 @@ class TransM(PairwiseModel):
         self.ent_embeddings = NamedEmbedding("ent_embedding", self.tot_entity, self.hidden_size)
         self.rel_embeddings = NamedEmbedding("rel_embedding", self.tot_relation, self.hidden_size)
 
-        rel_head = {x: [] for x in range(self.tot_relation)}
-        rel_tail = {x: [] for x in range(self.tot_relation)}
-        rel_counts = {x: 0 for x in range(self.tot_relation)}
-        train_triples_ids = kwargs["knowledge_graph"].read_cache_data('triplets_train')
-        for t in train_triples_ids:
-            rel_head[t.r].append(t.h)
-            rel_tail[t.r].append(t.t)
-            rel_counts[t.r] += 1
-
-        theta = [1/np.log(2+rel_counts[x]/(1+len(rel_tail[x])) + rel_counts[x]/(1+len(rel_head[x]))) for x in range(self.tot_relation)]
-        self.theta = torch.from_numpy(np.asarray(theta, dtype=np.float32)).to(kwargs["device"])
+        train_h, train_r, train_t = kwargs["knowledge_graph"].read_cache_data('triplets_train_ids')
+        theta = self._relation_theta(train_h, train_r, train_t, self.tot_entity, self.tot_relation)
+        self.theta = torch.from_numpy(theta).to(kwargs["device"])
         nn.init.xavier_uniform_(self.ent_embeddings.weight)
         nn.init.xavier_uniform_(self.rel_embeddings.weight)
 
@@ -365,11 +444,7 @@ class TransM(PairwiseModel):
             Returns:
                 Tensors: the scores of evaluationReturns head, relation and tail embedding Tensors.
         """
-        h_e, r_e, t_e = self.embed(h, r, t)
-
-        norm_h_e = F.normalize(h_e, p=2, dim=-1)
-        norm_r_e = F.normalize(r_e, p=2, dim=-1)
-        norm_t_e = F.normalize(t_e, p=2, dim=-1)
+        norm_h_e, norm_r_e, norm_t_e = self.embed(h, r, t)
 
         r_theta = self.theta[r]
 
@@ -387,16 +462,61 @@ class TransM(PairwiseModel):
                t (Tensor): Tail entity ids of the triple.
 
             Returns:
-                Tensors: Returns head, relation and tail embedding Tensors.
+                Tensors: Returns L2-normalized head, relation and tail embedding Tensors.
         """
-        emb_h = self.ent_embeddings(h)
-        emb_r = self.rel_embeddings(r)
-        emb_t = self.ent_embeddings(t)
+        # normalize only the gathered rows rather than the whole tables.
+        emb_h = F.normalize(self.ent_embeddings(h), p=2, dim=-1)
+        emb_r = F.normalize(self.rel_embeddings(r), p=2, dim=-1)
+        emb_t = F.normalize(self.ent_embeddings(t), p=2, dim=-1)
 
         return emb_h, emb_r, emb_t
 
+    @staticmethod
+    def _relation_theta(h, r, t, tot_entity, tot_relation):
+        """Calculates the relation-specific weights from the mapping property of each relation.
+
+           Args:
+               h (ndarray): Head entity ids of the training triples.
+               r (ndarray): Relation ids of the training triples.
+               t (ndarray): Tail entity ids of the training triples.
+               tot_entity (int): Total number of entities.
+               tot_relation (int): Total number of relations.
+
+            Returns:
+                ndarray: Returns the float32 weights theta(r) of shape [tot_relation].
+        """
+        rel_counts = np.bincount(r, minlength=tot_relation)
+        # distinct (r, h) and (r, t) pairs, encoded as single integers, counted per relation.
+        head_counts = np.bincount(np.unique(r * tot_entity + h) // tot_entity, minlength=tot_relation)
+        tail_counts = np.bincount(np.unique(r * tot_entity + t) // tot_entity, minlength=tot_relation)
+
+        theta = 1 / np.log(2 + rel_counts / (1 + tail_counts) + rel_counts / (1 + head_counts))
+        return theta.astype(np.float32)
+
+    def predict_tail_score(self, h, r):
+        norm_h_e = F.normalize(self.ent_embeddings(h), p=2, dim=-1)
+        norm_r_e = F.normalize(self.rel_embeddings(r), p=2, dim=-1)
+        norm_ent_e = self._normalized_entities()
+        # [b, k], [b, k], [tot_ent, k]
+
+        return self.theta[r].unsqueeze(-1) * self._distance_to_all(norm_h_e + norm_r_e, norm_ent_e)
+
+    def predict_head_score(self, t, r):
+        norm_t_e = F.normalize(self.ent_embeddings(t), p=2, dim=-1)
+        norm_r_e = F.normalize(self.rel_embeddings(r), p=2, dim=-1)
+        norm_ent_e = self._normalized_entities()
+
+        # ||e + r - t|| = ||e - (t - r)||
+        return self.theta[r].unsqueeze(-1) * self._distance_to_all(norm_t_e - norm_r_e, norm_ent_e)
 
-class TransR(PairwiseModel):
+    def predict_tail_rank(self, h, r, topk=-1):
+        return self._rank_candidates(self.predict_tail_score(h, r), topk)
+
+    def predict_head_rank(self, t, r, topk=-1):
+        return self._rank_candidates(self.predict_head_score(t, r), topk)
+
+
+class TransR(_EntityScanModel):
     """
         `Learning Entity and Relation Embeddings for Knowledge Graph Completion`_ (TransR) is a translation based knowledge graph embedding method. Similar to TransE and TransH, it also
         builds entity and relation embeddings by regarding a relation as translation from head entity to tail
@@ -421,24 +541,37 @@ class TransR(PairwiseModel):
             http://nlp.csai.tsinghua.edu.cn/~lyk/publications/aaai2015_transr.pdf
     """
 
+    score_tile_size = 64  # queries per distance call, bounding its [tile, tot_ent] temporaries.
+
     def __init__(self, **kwargs):
         super(TransR, self).__init__(self.__class__.__name__.lower())
         param_list = ["tot_entity", "tot_relation", "rel_hidden_size", "ent_hidden_size", "l1_flag"]
         param_dict = self.load_params(param_list, kwargs)
         self.__dict__.update(param_dict)
+        self.rel_matrix_rank = kwargs.get("rel_matrix_rank", 0)
 
         self.ent_embeddings = NamedEmbedding("ent_embedding", self.tot_entity, self.ent_hidden_size)
         self.rel_embeddings = NamedEmbedding("rel_embedding", self.tot_relation, self.rel_hidden_size)
-        self.rel_matrix = NamedEmbedding("rel_matrix", self.tot_relation, self.ent_hidden_size * self.rel_hidden_size)
         nn.init.xavier_uniform_(self.ent_embeddings.weight)
         nn.init.xavier_uniform_(self.rel_embeddings.weight)
-        nn.init.xavier_uniform_(self.rel_matrix.weight)
+
+        if self.rel_matrix_rank > 0:
+            # M_r = U_r * V_r, storing (k + d) * rank instead of k * d values per relation.
+            self.rel_matrix_u = NamedEmbedding("rel_matrix_u", self.tot_relation, self.ent_hidden_size * self.rel_matrix_rank)
+            self.rel_matrix_v = NamedEmbedding("rel_matrix_v", self.tot_relation, self.rel_matrix_rank * self.rel_hidden_size)
+            nn.init.xavier_uniform_(self.rel_matrix_u.weight)
+            nn.init.xavier_uniform_(self.rel_matrix_v.weight)
+            rel_matrices = [self.rel_matrix_u, self.rel_matrix_v]
+        else:
+            self.rel_matrix = NamedEmbedding("rel_matrix", self.tot_relation, self.ent_hidden_size * self.rel_hidden_size)
+            nn.init.xavier_uniform_(self.rel_matrix.weight)
+            rel_matrices = [self.rel_matrix]
+        self._proj_ent_cache = None  # (relation, projected entity table)
 
         self.parameter_list = [
             self.ent_embeddings,
             self.rel_embeddings,
-            self.rel_matrix,
-        ]
+        ] + rel_matrices
 
         self.loss = Criterion.pairwise_hinge
 
@@ -452,6 +585,10 @@ class TransR(PairwiseModel):
             e = torch.matmul(e, matrix)
         return e.view(-1, self.rel_hidden_size)
 
+    def clear_cache(self):
+        super(TransR, self).clear_cache()
+        self._proj_ent_cache = None
+
     def embed(self, h, r, t):
         """Function to get the embedding value.
 
@@ -461,32 +598,45 @@ class TransR(PairwiseModel):
                t (Tensor): Tail entity ids of the triple.
 
             Returns:
-                Tensors: Returns head, relation and tail embedding Tensors.
+                Tensors: Returns L2-normalized projected head, relation and projected tail embedding Tensors.
         """
         h_e = self.ent_embeddings(h)
-        r_e = self.rel_embeddings(r)
         t_e = self.ent_embeddings(t)
 
         h_e = F.normalize(h_e, p=2, dim=-1)
-        r_e = F.normalize(r_e, p=2, dim=-1)
         t_e = F.normalize(t_e, p=2, dim=-1)
 
-        h_e = torch.unsqueeze(h_e, 1)
-        t_e = torch.unsqueeze(t_e, 1)
-        # [b, 1, k]
-
-        matrix = self.rel_matrix(r)
-        # [b, k, d]
+        # batches reuse few relations, so look up each distinct relation once and expand.
+        uniq_r, inv = torch.unique(r, return_inverse=True)
+        r_e = F.normalize(self.rel_embeddings(uniq_r), p=2, dim=-1)[inv]
+        projection = [matrix[inv] for matrix in self._rel_projection(uniq_r)]
+        # [b, k, d], or [b, k, rank] and [b, rank, d] when factored
 
-        transform_h_e = self.transform(h_e, matrix)
-        transform_t_e = self.transform(t_e, matrix)
-        # [b, 1, d] = [b, 1, k] * [b, k, d]
+        for matrix in projection:
+            h_e = torch.einsum('bk,bkd->bd', h_e, matrix)
+            t_e = torch.einsum('bk,bkd->bd', t_e, matrix)
+        # [b, d] = [b, k] * [b, k, d]
 
-        h_e = torch.squeeze(transform_h_e, axis=1)
-        t_e = torch.squeeze(transform_t_e, axis=1)
-        # [b, d]
+        h_e = F.normalize(h_e, p=2, dim=-1)
+        t_e = F.normalize(t_e, p=2, dim=-1)
         return h_e, r_e, t_e
 
+    def _rel_projection(self, r):
+        """Gathers the projection of each relation as a chain of matrices.
+
+           Args:
+               r (Tensor): Relation ids.
+
+            Returns:
+                list: Returns [M_r] of shape [n, k, d], or [U_r, V_r] of shapes [n, k, rank]
+                and [n, rank, d] when rel_matrix_rank is set.
+        """
+        if self.rel_matrix_rank > 0:
+            return [self.rel_matrix_u(r).view(-1, self.ent_hidden_size, self.rel_matrix_rank),
+                    self.rel_matrix_v(r).view(-1, self.rel_matrix_rank, self.rel_hidden_size)]
+
+        return [self.rel_matrix(r).view(-1, self.ent_hidden_size, self.rel_hidden_size)]
+
     def forward(self, h, r, t):
         """Function to get the embedding value.
 
@@ -498,17 +648,95 @@ class TransR(PairwiseModel):
             Returns:
                 Tensors: the scores of evaluationReturns head, relation and tail embedding Tensors.
         """
-        h_e, r_e, t_e = self.embed(h, r, t)
-
-        norm_h_e = F.normalize(h_e, p=2, dim=-1)
-        norm_r_e = F.normalize(r_e, p=2, dim=-1)
-        norm_t_e = F.normalize(t_e, p=2, dim=-1)
+        # embed already returns normalized vectors.
+        norm_h_e, norm_r_e, norm_t_e = self.embed(h, r, t)
 
         if self.l1_flag:
             return torch.norm(norm_h_e + norm_r_e - norm_t_e, p=1, dim=-1)
 
         return torch.norm(norm_h_e + norm_r_e - norm_t_e, p=2, dim=-1)
 
+    def predict_tail_score(self, h, r):
+        return self._score_all(h, r, direction="tail")
+
+    def predict_head_score(self, t, r):
+        return self._score_all(t, r, direction="head")
+
+    def predict_tail_rank(self, h, r, topk=-1):
+        return self._rank_candidates(self.predict_tail_score(h, r), topk)
+
+    def predict_head_rank(self, t, r, topk=-1):
+        return self._rank_candidates(self.predict_head_score(t, r), topk)
+
+    def _score_all(self, e, r, direction):
+        """Calculates the distances between the queries and every candidate entity.
+
+            Entities are projected once per distinct relation in the batch instead of
+            once per query. The queries sharing a relation are scored in tiles of
+            score_tile_size, so the intermediate [tile, tot_ent] tensors of the distance
+            computation stay bounded before each tile is copied into the [b, tot_ent] output.
+
+           Args:
+               e (Tensor): Head entity ids if direction is "tail", tail entity ids otherwise.
+               r (Tensor): Relation ids.
+               direction (str): Either "tail" or "head".
+
+            Returns:
+                Tensors: Returns the distances of shape [b, tot_ent].
+        """
+        norm_ent_e = self._normalized_entities()
+        norm_r_e = F.normalize(self.rel_embeddings(r), p=2, dim=-1)
+        # [tot_ent, k], [b, d]
+
+        score = norm_r_e.new_empty((r.shape[0], self.tot_entity))
+
+        uniq_r, inv = torch.unique(r, return_inverse=True)
+        for idx, rel in enumerate(uniq_r):
+            rows = (inv == idx).nonzero(as_tuple=True)[0]
+            proj_ent_e = self._projected_entities(rel, norm_ent_e)
+            # [tot_ent, d]
+
+            # each tile allocates its [tile, tot_ent] distance temporaries, then writes its rows of score.
+            for tile in torch.split(rows, self.score_tile_size):
+                if direction == "tail":
+                    query = proj_ent_e[e[tile]] + norm_r_e[tile]
+                else:
+                    # ||e + r - t|| = ||(t - r) - e||
+                    query = proj_ent_e[e[tile]] - norm_r_e[tile]
+
+                score[tile] = self._distance_to_all(query, proj_ent_e)
+                # [tile, tot_ent]
+
+        return score
+
+    def _projected_entities(self, rel, norm_ent_e):
+        """Projects every entity into the space of a relation.
+
+            The last projection is cached while gradients are disabled, so the head and
+            tail queries of a test triple share one [tot_ent, k] x [k, d] matmul. It is
+            dropped together with the normalized entity table.
+
+           Args:
+               rel (Tensor): A single relation id.
+               norm_ent_e (Tensor): L2-normalized entity embeddings of shape [tot_ent, k].
+
+            Returns:
+                Tensors: Returns the normalized projected entities of shape [tot_ent, d].
+        """
+        rel = int(rel)
+        if not torch.is_grad_enabled() and self._proj_ent_cache is not None and self._proj_ent_cache[0] == rel:
+            return self._proj_ent_cache[1]
+
+        proj_ent_e = norm_ent_e
+        for matrix in self._rel_projection(rel):
+            proj_ent_e = torch.matmul(proj_ent_e, matrix[0])
+        proj_ent_e = F.normalize(proj_ent_e, p=2, dim=-1)
+        # [tot_ent, d] = [tot_ent, k] * [k, d]
+
+        if not torch.is_grad_enabled():
+            self._proj_ent_cache = (rel, proj_ent_e)
+        return proj_ent_e
+
 
 class SLM(PairwiseModel):
     """
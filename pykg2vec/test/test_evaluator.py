@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+This module is for testing unit functions of the evaluator
+"""
+import numpy as np
+
+from pykg2vec.utils.evaluator import MetricCalculator
+
+
+def get_metric_calculator(hr_t, tr_h):
+    """Function to get a MetricCalculator without loading a knowledge graph."""
+    calculator = MetricCalculator.__new__(MetricCalculator)
+    calculator.hr_t = hr_t
+    calculator.tr_h = tr_h
+    return calculator
+
+
+def test_rank_by_score_matches_rank_by_candidates():
+    """Function to test that the score-based ranks match the ranks on the sorted candidates."""
+    rng = np.random.RandomState(0)
+    score = rng.permutation(20).astype(np.float32) / 10
+    h, r, t = 3, 0, 7
+    calculator = get_metric_calculator({(h, r): {2, 7, 11, 15}}, {(t, r): {3, 4, 18}})
+
+    # the candidates are sorted by descending distance, the best one last.
+    candidate = np.argsort(-score)
+
+    assert calculator.get_tail_rank_by_score(score, h, r, t) == calculator.get_tail_rank(candidate, h, r, t)
+    assert calculator.get_head_rank_by_score(score, h, r, t) == calculator.get_head_rank(candidate, h, r, t)
+
+
+def test_rank_by_score_with_ties():
+    """Function to test that the candidates tied with the target are ranked before it."""
+    score = np.array([0.5, 0.1, 0.5, 0.5, 0.9], dtype=np.float32)
+    h, r, t = 2, 0, 0
+    calculator = get_metric_calculator({(h, r): {0, 3}}, {(t, r): {2}})
+
+    # 1 is closer, 2 and 3 are tied with the target 0 and 3 is filtered out.
+    assert calculator.get_tail_rank_by_score(score, h, r, t) == (3, 2)
+    # 1 is closer, 0 and 3 are tied with the target 2.
+    assert calculator.get_head_rank_by_score(score, h, r, t) == (3, 3)
+
+    # a constant score gets the worst rank.
+    constant = np.zeros(5, dtype=np.float32)
+    assert calculator.get_tail_rank_by_score(constant, h, r, t) == (4, 3)
@@ -12,7 +12,7 @@ from pykg2vec.data.kgcontroller import KnowledgeGraph
 
 
 @pytest.mark.skip(reason="This is a functional method.")
-def testing_function_with_args(name, l1_flag, display=False):
+def testing_function_with_args(name, l1_flag, display=False, rel_matrix_rank=0):
     """Function to test the models with arguments."""
     # getting the customized configurations from the command-line arguments.
     args = KGEArgParser().get_args([])
@@ -31,6 +31,7 @@ def testing_function_with_args(name, l1_flag, display=False):
     config.disp_result = display
     config.save_model = True
     config.l1_flag = l1_flag
+    config.rel_matrix_rank = rel_matrix_rank
     config.debug = True
 
     model = model_def(**config.__dict__)
@@ -87,6 +88,10 @@ def test_inference(model_name):
     """Function to test Algorithms with arguments."""
     testing_function_with_args(model_name, True)
 
+def test_inference_factored_transr():
+    """Function to test that TransR with low-rank relation matrices is saved and reloaded."""
+    testing_function_with_args('transr', True, rel_matrix_rank=2)
+
 def test_inference_on_pretrained_model():
     args = KGEArgParser().get_args([])
     config_def, model_def = Importer().import_model_config("transe")
@@ -41,6 +41,7 @@ def test_known_datasets(dataset_name):
     assert kg_metadata.tot_entity > 0
 
     assert len(knowledge_graph.read_cache_data('triplets_train')) > 0
+    assert knowledge_graph.read_cache_data('triplets_train_ids').shape == (3, kg_metadata.tot_train_triples)
     assert len(knowledge_graph.read_cache_data('triplets_test')) > 0
     assert len(knowledge_graph.read_cache_data('triplets_valid')) > 0
     assert len(knowledge_graph.read_cache_data('hr_t')) > 0
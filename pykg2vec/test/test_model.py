@@ -4,8 +4,11 @@
 This module is for testing unit functions of model
 """
 import pytest
+import numpy as np
+import torch
 
 from pykg2vec.common import KGEArgParser, Importer
+from pykg2vec.models.pairwise import TransM, TransR
 from pykg2vec.utils.trainer import Trainer
 from pykg2vec.data.kgcontroller import KnowledgeGraph
 
@@ -45,6 +48,93 @@ def test_kge_methods(model_name):
     """Function to test a set of KGE algorithsm."""
     testing_function(model_name)
 
+class ToyKnowledgeGraph:
+    """Knowledge graph stand-in serving the training triples TransM reads at construction."""
+
+    def __init__(self, triples):
+        self.triples = np.array(triples, dtype=np.int64).T
+
+    def read_cache_data(self, key):
+        assert key == 'triplets_train_ids'
+        return self.triples
+
+def get_pairwise_model(name, l1_flag):
+    """Function to get a small TransM or TransR (full or factored) without preparing a dataset."""
+    if name == 'transm':
+        knowledge_graph = ToyKnowledgeGraph([(0, 0, 1), (2, 0, 3), (0, 1, 1), (0, 1, 2), (4, 2, 5)])
+        return TransM(tot_entity=12, tot_relation=3, hidden_size=8, l1_flag=l1_flag,
+                      knowledge_graph=knowledge_graph, device='cpu')
+
+    rel_matrix_rank = 2 if name == 'transr_factored' else 0
+    model = TransR(tot_entity=12, tot_relation=3, ent_hidden_size=8, rel_hidden_size=6,
+                   l1_flag=l1_flag, rel_matrix_rank=rel_matrix_rank)
+    # tiles smaller than the queries sharing a relation.
+    model.score_tile_size = 2
+    return model
+
+@pytest.mark.parametrize("model_name", ['transm', 'transr', 'transr_factored'])
+@pytest.mark.parametrize("l1_flag", [True, False])
+def test_predict_score_matches_forward(model_name, l1_flag):
+    """Function to test that the scores of all the candidates agree with forward on the true triples."""
+    torch.manual_seed(0)
+    model = get_pairwise_model(model_name, l1_flag)
+
+    h = torch.LongTensor([0, 1, 2, 3, 4, 5, 6])
+    r = torch.LongTensor([1, 0, 1, 2, 1, 0, 1])
+    t = torch.LongTensor([7, 8, 9, 10, 11, 0, 1])
+    rows = torch.arange(h.shape[0])
+
+    with torch.no_grad():
+        # the second pass reuses the cached entity tables, the third one follows
+        # an update of the weights between train() and eval(), which drops them.
+        for step in range(3):
+            expected = model(h, r, t)
+            tail_score = model.predict_tail_score(h, r)
+            head_score = model.predict_head_score(t, r)
+
+            assert tail_score.shape == (h.shape[0], model.tot_entity)
+            assert torch.allclose(tail_score[rows, t], expected, rtol=1e-4, atol=1e-5)
+            assert torch.allclose(head_score[rows, h], expected, rtol=1e-4, atol=1e-5)
+
+            if step == 1:
+                model.train()
+                for emb in model.parameter_list:
+                    emb.weight.add_(0.1)
+                model.eval()
+
+@pytest.mark.parametrize("model_name", ['transm', 'transr'])
+def test_predict_rank_topk(model_name):
+    """Function to test that a small topk returns the closest candidates, the best one last."""
+    torch.manual_seed(0)
+    model = get_pairwise_model(model_name, l1_flag=False)
+
+    h = torch.LongTensor([0, 1, 2])
+    r = torch.LongTensor([1, 0, 2])
+    with torch.no_grad():
+        score = model.predict_tail_score(h, r)
+        tails = model.predict_tail_rank(h, r, topk=3)
+        all_tails = model.predict_tail_rank(h, r)
+
+    assert torch.equal(tails, score.argsort(dim=-1)[:, :3].flip(-1))
+    assert torch.equal(all_tails[:, -3:], tails)
+
+def test_kge_methods_factored_transr():
+    """Function to test TransR with low-rank relation matrices."""
+    testing_function('transr', rel_matrix_rank=2)
+
+def test_transm_relation_theta():
+    """Function to test the TransM relation weights on a toy set of triples."""
+    # relation 0 is 1-to-1, relation 1 is 1-to-N and relation 2 has no triples.
+    h, r, t = np.array([(0, 0, 1), (2, 0, 3), (0, 1, 1), (0, 1, 2), (0, 1, 3)], dtype=np.int64).T
+    theta = TransM._relation_theta(h, r, t, tot_entity=5, tot_relation=3)
+
+    # theta(r) = 1 / log(2 + #triples / (1 + #tails) + #triples / (1 + #heads))
+    expected = [1 / np.log(2 + 2 / 3 + 2 / 3),
+                1 / np.log(2 + 3 / 4 + 3 / 2),
+                1 / np.log(2)]
+    assert theta.dtype == np.float32
+    np.testing.assert_allclose(theta, expected, rtol=1e-6)
+
 def test_error_on_importing_model():
     with pytest.raises(ValueError) as e:
         Importer().import_model_config("unknown")
@@ -52,7 +142,7 @@ def test_error_on_importing_model():
 
 
 @pytest.mark.skip(reason="This is a functional method.")
-def testing_function(name):
+def testing_function(name, **config_overrides):
     """Function to test the models with arguments."""
     # getting the customized configurations from the command-line arguments.
     args = KGEArgParser().get_args(['-exp', 'True'])
@@ -73,6 +163,8 @@ def testing_function(name):
     config.ent_hidden_size = 10
     config.rel_hidden_size = 10
     config.channels = 2
+    for key, value in config_overrides.items():
+        setattr(config, key, value)
 
     model = model_def(**config.__dict__)
 
@@ -67,6 +67,27 @@ class MetricCalculator:
         self.f_rank_head.append(f_h_rank)
         self.f_rank_tail.append(f_t_rank)
 
+    def append_score_result(self, result):
+        """Function to append the result given as candidate scores instead of sorted candidates.
+
+            The ranks are obtained by counting the candidates with a distance not larger
+            than the target's, which avoids sorting all the entities.
+        """
+        tail_score = result[0]
+        head_score = result[1]
+
+        h, r, t = result[2], result[3], result[4]
+
+        self.epoch = result[5]
+
+        t_rank, f_t_rank = self.get_tail_rank_by_score(tail_score, h, r, t)
+        h_rank, f_h_rank = self.get_head_rank_by_score(head_score, h, r, t)
+
+        self.rank_head.append(h_rank)
+        self.rank_tail.append(t_rank)
+        self.f_rank_head.append(f_h_rank)
+        self.f_rank_tail.append(f_t_rank)
+
     def get_tail_rank(self, tail_candidate, h, r, t):
         """Function to evaluate the tail rank.
 
@@ -122,6 +143,50 @@ class MetricCalculator:
 
         return hrank, fhrank
 
+    def get_tail_rank_by_score(self, tail_score, h, r, t):
+        """Function to evaluate the tail rank from the distances of all the tail candidates.
+
+            Ties are counted pessimistically: a candidate at the same distance as the
+            target is ranked before it, so a model scoring every entity equally gets
+            the worst rank instead of the best one.
+
+           Args:
+               tail_score (ndarray): Distances of every entity as the tail for the given head, relation pair
+               h (int): head id
+               r (int): relation id
+               t (int): tail id
+
+            Returns:
+                Tensors: Returns tail rank and filetered tail rank
+        """
+        better = tail_score <= tail_score[t]
+        better[t] = False
+        trank = int(np.sum(better))
+        ftrank = trank - int(np.sum(better[list(self.hr_t[(h, r)])]))
+
+        return trank, ftrank
+
+    def get_head_rank_by_score(self, head_score, h, r, t):
+        """Function to evaluate the head rank from the distances of all the head candidates.
+
+            Ties are counted pessimistically, as in get_tail_rank_by_score.
+
+           Args:
+               head_score (ndarray): Distances of every entity as the head for the given tail, relation pair
+               h (int): head id
+               r (int): relation id
+               t (int): tail id
+
+            Returns:
+                Tensors: Returns head rank and filetered head rank
+        """
+        better = head_score <= head_score[h]
+        better[h] = False
+        hrank = int(np.sum(better))
+        fhrank = hrank - int(np.sum(better[list(self.tr_h[(t, r)])]))
+
+        return hrank, fhrank
+
     def settle(self):
         head_ranks = np.asarray(self.rank_head, dtype=np.float32)+1
         tail_ranks = np.asarray(self.rank_tail, dtype=np.float32)+1
@@ -272,6 +337,14 @@ class Evaluator:
         _, rank = torch.topk(preds, k=topk)
         return rank
 
+    def test_tail_score(self, h, r):
+        score = self.model.predict_tail_score(torch.LongTensor([h]).to(self.config.device), torch.LongTensor([r]).to(self.config.device))
+        return score.squeeze(0)
+
+    def test_head_score(self, r, t):
+        score = self.model.predict_head_score(torch.LongTensor([t]).to(self.config.device), torch.LongTensor([r]).to(self.config.device))
+        return score.squeeze(0)
+
     def test_rel_rank(self, h, t, topk=-1):
         if hasattr(self.model, 'predict_rel_rank'):
             # TODO: This is not implemented for conve, convkb, proje_pointwise, tucker, interacte and hyper
@@ -307,6 +380,10 @@ class Evaluator:
 
     def test(self, data, num_of_test, epoch=None):
         self.metric_calculator.reset()
+        # models caching their entity tables for evaluation rebuild them from the current
+        # weights, and release them once the test is over.
+        if hasattr(self.model, 'clear_cache'):
+            self.model.clear_cache()
 
         progress_bar = tqdm(range(num_of_test))
         for i in progress_bar:
@@ -317,6 +394,16 @@ class Evaluator:
             r_tensor = torch.LongTensor([r])
             t_tensor = torch.LongTensor([t])
 
+            if hasattr(self.model, 'predict_tail_score') and hasattr(self.model, 'predict_head_score'):
+                # rank by counting better candidates rather than sorting all the entities.
+                hscore = self.test_head_score(r_tensor, t_tensor)
+                tscore = self.test_tail_score(h_tensor, r_tensor)
+
+                result_data = [tscore.detach().cpu().numpy(), hscore.detach().cpu().numpy(), h, r, t, epoch]
+
+                self.metric_calculator.append_score_result(result_data)
+                continue
+
             hrank = self.test_head_rank(r_tensor, t_tensor, self.config.tot_entity)
             trank = self.test_tail_rank(h_tensor, r_tensor, self.config.tot_entity)
 
@@ -324,6 +411,9 @@ class Evaluator:
 
             self.metric_calculator.append_result(result_data)
 
+        if hasattr(self.model, 'clear_cache'):
+            self.model.clear_cache()
+
         self.metric_calculator.settle()
         self.metric_calculator.display_summary()
 
@@ -145,8 +145,11 @@ class Trainer:
 
     # Training related functions:
     def train_step_pairwise(self, pos_h, pos_r, pos_t, neg_h, neg_r, neg_t):
-        pos_preds = self.model(pos_h, pos_r, pos_t)
-        neg_preds = self.model(neg_h, neg_r, neg_t)
+        # score the positive and negative triples in one call, so that the embedding
+        # lookups of a batch (e.g., the distinct relations in TransR) are shared by both.
+        num_pos = pos_h.shape[0]
+        preds = self.model(torch.cat([pos_h, neg_h]), torch.cat([pos_r, neg_r]), torch.cat([pos_t, neg_t]))
+        pos_preds, neg_preds = preds[:num_pos], preds[num_pos:]
 
         if self.model.model_name.lower() == "rotate":
             loss = self.model.loss(pos_preds, neg_preds, self.config.neg_rate, self.config.alpha)
@@ -413,6 +416,7 @@ class Trainer:
             #     print(key, " ", value)
             self.config.__dict__['lmbda'] = config_temp.__dict__['lmbda']
             self.config.__dict__['l1_flag'] = config_temp.__dict__['l1_flag']
+            self.config.__dict__['rel_matrix_rank'] = config_temp.__dict__.get('rel_matrix_rank', 0)
             self.config.__dict__['learning_rate'] = config_temp.__dict__['learning_rate']
             self.config.__dict__['hidden_size'] = config_temp.__dict__['hidden_size']
             self.config.__dict__['batch_size'] = config_temp.__dict__['batch_size']